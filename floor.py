@@ -1,8 +1,24 @@
-from collections import defaultdict
-import os
 import csv
+from functools import lru_cache
+import mmap
+import os
+import numpy as np
 from xml.sax.saxutils import escape
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # fall back to the mmap parser below
+
+from svg_style import (
+    AREA_UNIT_FT2,
+    AREA_UNIT_M2,
+    ROUND_AREA,
+    SQM_TO_SQFT,
+    build_header,
+    svg_footer,
+)
+
 # ===============================
 # USER CONTROLS
 # ===============================
@@ -19,118 +35,157 @@ START_Y = 180
 
 ROW_GAP = 42
 
-FONT_FAMILY_REGULAR = "Roboto"
-FONT_FAMILY_LIGHT = "Roboto Light"
-
-FONT_SIZE_MAIN_TITLE = 36  # For grand total
-FONT_SIZE_GROUP = 24
-FONT_SIZE_ITEM = 20
+# Precompiled SVG text templates with the constant x coordinates baked in
+# at import time, so each row substitutes only its y position and text
+TPL_GROUP = f'<text x="{START_X_NAME}" y="%d" class="group">%s</text>\n'
+TPL_GROUP_AREA = f'<text x="{START_X_AREA}" y="%d" class="group-area">%s</text>\n'
+TPL_ITEM = f'<text x="{START_X_NAME + 20}" y="%d" class="item">%s</text>\n'
+TPL_AREA = f'<text x="{START_X_AREA}" y="%d" class="area">%s</text>\n'
 
-COLOR_MAIN_TITLE = "#000000"
-COLOR_GROUP = "#000000"
-COLOR_ITEM = "#222222"
-COLOR_AREA = "#444444"
 
-AREA_UNIT_M2 = " m²"
-AREA_UNIT_FT2 = " sq.ft"
-ROUND_AREA = 2
+@lru_cache(maxsize=4096)
+def fmt_area(m2, ft2):
+    """Format a rounded m²/ft² pair; cached because schedules repeat areas."""
+    return f"{m2}{AREA_UNIT_M2} / {ft2}{AREA_UNIT_FT2}"
 
-# Conversion factor
-SQM_TO_SQFT = 10.7639
 
 # ===============================
-# SVG HEADER
+# PROCESS CSV FILE
 # ===============================
 
-svg_header = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     width="{PAGE_WIDTH}" height="{PAGE_HEIGHT}"
-     viewBox="0 0 {PAGE_WIDTH} {PAGE_HEIGHT}">
-
-<style>
-  @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400&amp;display=swap');
-  .main-title {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_MAIN_TITLE}px;
-    font-weight: bold;
-    fill: {COLOR_MAIN_TITLE};
-  }}
-  .group {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_GROUP}px;
-    font-weight: bold;
-    fill: {COLOR_GROUP};
-  }}
-  .item {{
-    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
-    font-size: {FONT_SIZE_ITEM}px;
-    fill: {COLOR_ITEM};
-  }}
-  .area {{
-    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
-    font-size: {FONT_SIZE_ITEM}px;
-    fill: {COLOR_AREA};
-    text-anchor: end;
-  }}
-  .group-area {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_GROUP}px;
-    font-weight: bold;
-    fill: {COLOR_GROUP};
-    text-anchor: end;
-  }}
-</style>
-'''
-
-svg_footer = "</svg>"
 
-# ===============================
-# PROCESS CSV FILE
-# ===============================
+# Leading characters of a plausible float, in both str and bytes form;
+# checked before calling float() so malformed rows skip the exception
+# machinery entirely
+_FLOAT_LEAD = frozenset("0123456789+-.") | {c.encode() for c in "0123456789+-."}
+
+
+def _process_csv_mmap(csv_file_path):
+    """Fallback parser used when polars is unavailable: memory-map the file
+    and scan just the two needed columns by hand."""
+    with open(csv_file_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = mm[:]
+        mm.close()
+
+    header_line, _, body = data.partition(b"\n")
+    cols = [c.strip() for c in header_line.decode("utf-8-sig").strip().split(",")]
+    ix_name = cols.index("Space")
+    ix_area = cols.index("NetArea")
+    max_ix = max(ix_name, ix_area)
+
+    if b'"' in body:
+        # Quoted fields present — hand row splitting back to csv.reader
+        rows = csv.reader(body.decode("utf-8").splitlines())
+    else:
+        # Well-formed unquoted CSV: plain byte splits, no csv machinery
+        rows = (line.split(b",") for line in body.split(b"\n"))
+
+    # Parallel name/area lists per group — a plain dict probe instead of
+    # defaultdict's __missing__/factory dispatch on the hot path
+    groups = {}
+    group_totals = {}
+    total_area = 0
+
+    for parts in rows:
+        if len(parts) <= max_ix:
+            continue
+
+        name = parts[ix_name].strip()
+        area_raw = parts[ix_area].strip()
+
+        if not name or not area_raw:
+            continue
+
+        if area_raw[:1] not in _FLOAT_LEAD:
+            continue
+
+        try:
+            area_value = float(area_raw)
+            total_area += area_value
+        except ValueError:
+            continue
+
+        if isinstance(name, bytes):
+            name = name.decode("utf-8")
+
+        # Extract first word as group key: partition stops at the first
+        # space and allocates no token list (covers the no-space case too)
+        group_key = name.partition(" ")[0]
+
+        bucket = groups.get(group_key)
+        if bucket is None:
+            bucket = groups[group_key] = ([], [])
+        bucket[0].append(name)
+        bucket[1].append(area_value)
+        # Accumulate group totals in the same pass instead of re-walking
+        # every group afterwards
+        group_totals[group_key] = group_totals.get(group_key, 0.0) + area_value
+
+    # Sort groups by total area descending via native tuple comparison —
+    # no Python key function per comparison; the index keeps ties in
+    # first-seen order like the stable keyed sort did
+    pairs = sorted((-group_totals[k], i, k) for i, k in enumerate(groups))
+
+    sorted_groups = [
+        (k, (groups[k][0], np.asarray(groups[k][1], dtype=np.float64)))
+        for _, _, k in pairs
+    ]
+
+    return {
+        "sorted_groups": sorted_groups,
+        "total_area": total_area,
+        "group_totals": group_totals
+    }
 
 def process_csv_file(csv_file_path):
     """Process the CSV file and return organized data."""
-    groups = defaultdict(list)
-    total_area = 0
-    
-    with open(csv_file_path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        
-        for row in reader:
-            name = row.get("Space", "").strip()
-            area_raw = row.get("NetArea", "").strip()
-            
-            if not name or not area_raw:
-                continue
-            
-            try:
-                area_value = float(area_raw)
-                total_area += area_value
-            except ValueError:
-                continue
-            
-            # Extract first word as group key
-            # For example: "First Floor" -> "First", "Ground Floor Verandah" -> "Ground"
-            group_key = name.split()[0] if ' ' in name else name
-            
-            groups[group_key].append({
-                "name": name,
-                "area": area_value
-            })
-    
-    # Calculate group totals for sorting
-    group_totals = {}
-    for k, items in groups.items():
-        total_group_area = sum(item["area"] for item in items)
-        group_totals[k] = total_group_area
-    
-    # Sort groups by total area descending
-    sorted_groups = sorted(
-        groups.items(),
-        key=lambda g: group_totals[g[0]],
-        reverse=True
+    if pl is None:
+        return _process_csv_mmap(csv_file_path)
+
+    # Parse with polars: tokenizing, float conversion and null handling all
+    # happen on typed columns instead of a per-row Python loop
+    df = (
+        pl.read_csv(
+            csv_file_path,
+            columns=["Space", "NetArea"],
+            schema_overrides={"Space": pl.String, "NetArea": pl.Float64},
+            ignore_errors=True,
+        )
+        .drop_nulls()
+        .with_columns(pl.col("Space").str.strip_chars())
+        .filter(pl.col("Space") != "")
+    )
+
+    # Extract first word as group key
+    # For example: "First Floor" -> "First", "Ground Floor Verandah" -> "Ground"
+    df = df.with_columns(
+        pl.col("Space").str.splitn(" ", 2).struct.field("field_0").alias("group_key")
+    )
+
+    total_area = float(df["NetArea"].sum()) if df.height else 0
+
+    # Group totals aggregated and pre-sorted descending in one vectorized
+    # query, so no Python-level sum or sort pass is needed afterwards
+    totals_df = (
+        df.group_by("group_key", maintain_order=True)
+        .agg(pl.col("NetArea").sum())
+        .sort("NetArea", descending=True, maintain_order=True)
     )
-    
+    group_totals = dict(
+        zip(totals_df["group_key"].to_list(), totals_df["NetArea"].to_list())
+    )
+
+    # Split into per-group parallel columns (names, areas) — structure of
+    # arrays instead of a Python dict per row
+    groups = {
+        key[0]: (part["Space"].to_list(), part["NetArea"].to_numpy())
+        for key, part in df.partition_by("group_key", as_dict=True).items()
+    }
+
+    # totals_df is already sorted by total area descending
+    sorted_groups = [(k, groups[k]) for k in totals_df["group_key"].to_list()]
+
     return {
         "sorted_groups": sorted_groups,
         "total_area": total_area,
@@ -156,138 +211,113 @@ group_totals = file_data["group_totals"]
 # BUILD SVG CONTENT
 # ===============================
 
-elements = []
+# Escape each unique label once up front; the emit loops below then do
+# plain dict lookups instead of re-running escape() per row
+unique_names = set()
+for group_name, (names, _) in sorted_groups:
+    unique_names.add(group_name)
+    unique_names.update(names)
+escaped = {n: escape(n) for n in unique_names}
+
+# Compute the final page height up front from the row counts so the SVG
+# header is interpolated exactly once
+y_end = START_Y
+for _, (names, _) in sorted_groups:
+    y_end += ROW_GAP if len(names) == 1 else (len(names) + 1) * ROW_GAP + 12
+PAGE_HEIGHT = max(y_end + 100, PAGE_HEIGHT)
+
+svg_header = build_header(PAGE_WIDTH, PAGE_HEIGHT)
+
+# ===============================
+# WRITE SVG FILE
+# ===============================
+
+# Accumulate the document as pre-encoded UTF-8 bytes; text-mode writes
+# would re-encode every fragment mid-stream
+buf = bytearray(svg_header.encode("utf-8"))
+
 y = START_Y
 
 # Main title with TOTAL AREA
 total_m2 = round(total_area, ROUND_AREA)
 total_ft2 = round(total_area * SQM_TO_SQFT, ROUND_AREA)
-total_text = f"{total_m2}{AREA_UNIT_M2} / {total_ft2}{AREA_UNIT_FT2}"
+total_text = fmt_area(total_m2, total_ft2)
 
-elements.append(
-    f'<text x="{PAGE_WIDTH/2}" y="80" class="main-title" text-anchor="middle">AREA SCHEDULE</text>'
-)
-elements.append(
-    f'<text x="{PAGE_WIDTH/2}" y="130" class="main-title" text-anchor="middle">{total_text}</text>'
-)
+buf += (
+    f'<text x="{PAGE_WIDTH/2}" y="80" class="main-title" text-anchor="middle">AREA SCHEDULE</text>\n'
+).encode("utf-8")
+buf += (
+    f'<text x="{PAGE_WIDTH/2}" y="130" class="main-title" text-anchor="middle">{total_text}</text>\n'
+).encode("utf-8")
 
 # Process groups
-for group_name, items in sorted_groups:
+for group_name, (names, areas) in sorted_groups:
+    # Sort items inside group by area descending (stable argsort on the
+    # area column instead of a Python key-function sort)
+    order = np.argsort(-areas, kind="stable")
+    areas = areas[order]
+
+    # Vectorize rounding and m²→ft² conversion for the whole group at once
+    m2_arr = np.round(areas, ROUND_AREA)
+    ft2_arr = np.round(areas * SQM_TO_SQFT, ROUND_AREA)
+
     # Single-space entry (no sub-items)
-    if len(items) == 1:
-        item = items[0]
-        area_m2 = round(item['area'], ROUND_AREA)
-        area_ft2 = round(item['area'] * SQM_TO_SQFT, ROUND_AREA)
-        area_text = f"{area_m2}{AREA_UNIT_M2} / {area_ft2}{AREA_UNIT_FT2}"
-        
+    if len(names) == 1:
+        area_text = fmt_area(m2_arr[0], ft2_arr[0])
+
         # Name on the left
-        elements.append(
-            f'<text x="{START_X_NAME}" y="{y}" class="group">{escape(item["name"])}</text>'
-        )
+        buf += (TPL_GROUP % (y, escaped[names[0]])).encode("utf-8")
         # Area on the right (right-aligned)
-        elements.append(
-            f'<text x="{START_X_AREA}" y="{y}" class="group-area">{area_text}</text>'
-        )
+        buf += (TPL_GROUP_AREA % (y, area_text)).encode("utf-8")
         y += ROW_GAP
         continue  # skip the normal group loop
-    
+
     # Multi-space group heading with total area
-    group_total = round(sum(item["area"] for item in items), ROUND_AREA)
+    group_total = round(float(areas.sum()), ROUND_AREA)
     total_ft2 = round(group_total * SQM_TO_SQFT, ROUND_AREA)
-    total_text = f"{group_total}{AREA_UNIT_M2} / {total_ft2}{AREA_UNIT_FT2}"
-    
+    total_text = fmt_area(group_total, total_ft2)
+
     # Group name on the left
-    elements.append(
-        f'<text x="{START_X_NAME}" y="{y}" class="group">{escape(group_name)}</text>'
-    )
+    buf += (TPL_GROUP % (y, escaped[group_name])).encode("utf-8")
     # Total area on the right (right-aligned)
-    elements.append(
-        f'<text x="{START_X_AREA}" y="{y}" class="group-area">(Total: {total_text})</text>'
-    )
+    buf += (TPL_GROUP_AREA % (y, f"(Total: {total_text})")).encode("utf-8")
     y += ROW_GAP
-    
-    # Sort items inside group by area descending
-    items.sort(key=lambda x: x["area"], reverse=True)
-    
-    for item in items:
-        area_m2 = round(item['area'], ROUND_AREA)
-        area_ft2 = round(item['area'] * SQM_TO_SQFT, ROUND_AREA)
-        area_text = f"{area_m2}{AREA_UNIT_M2} / {area_ft2}{AREA_UNIT_FT2}"
-        
+
+    for i, j in enumerate(order):
+        area_text = fmt_area(m2_arr[i], ft2_arr[i])
+
         # Item name on the left (indented)
-        elements.append(
-            f'<text x="{START_X_NAME + 20}" y="{y}" class="item">{escape(item["name"])}</text>'
-        )
+        buf += (TPL_ITEM % (y, escaped[names[j]])).encode("utf-8")
         # Item area on the right (right-aligned)
-        elements.append(
-            f'<text x="{START_X_AREA}" y="{y}" class="area">{area_text}</text>'
-        )
-        
+        buf += (TPL_AREA % (y, area_text)).encode("utf-8")
+
         y += ROW_GAP
-    
+
     # Space between groups
     y += 12
 
-# Adjust page height based on content
-PAGE_HEIGHT = max(y + 100, PAGE_HEIGHT)
-svg_header = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     width="{PAGE_WIDTH}" height="{PAGE_HEIGHT}"
-     viewBox="0 0 {PAGE_WIDTH} {PAGE_HEIGHT}">
-
-<style>
-  @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400&amp;display=swap');
-  .main-title {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_MAIN_TITLE}px;
-    font-weight: bold;
-    fill: {COLOR_MAIN_TITLE};
-  }}
-  .group {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_GROUP}px;
-    font-weight: bold;
-    fill: {COLOR_GROUP};
-  }}
-  .item {{
-    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
-    font-size: {FONT_SIZE_ITEM}px;
-    fill: {COLOR_ITEM};
-  }}
-  .area {{
-    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
-    font-size: {FONT_SIZE_ITEM}px;
-    fill: {COLOR_AREA};
-    text-anchor: end;
-  }}
-  .group-area {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_GROUP}px;
-    font-weight: bold;
-    fill: {COLOR_GROUP};
-    text-anchor: end;
-  }}
-</style>
-'''
-
-# ===============================
-# WRITE SVG FILE
-# ===============================
+buf += svg_footer.encode("utf-8")
 
-with open(SVG_FILE, "w", encoding="utf-8") as f:
-    f.write(svg_header)
-    f.write("\n".join(elements))
-    f.write(svg_footer)
+# One pre-encoded buffer, one write syscall
+fd = os.open(
+    SVG_FILE,
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+    0o644,
+)
+try:
+    os.write(fd, buf)
+finally:
+    os.close(fd)
 
 print(f"\nSVG generated → {SVG_FILE}")
 print(f"Total Area: {round(total_area, ROUND_AREA)} m² / {round(total_area * SQM_TO_SQFT, ROUND_AREA)} sq.ft")
 
 # Display group information
 print("\nGroup Summary:")
-for group_name, items in sorted_groups:
-    group_total = sum(item["area"] for item in items)
+for group_name, (names, areas) in sorted_groups:
+    group_total = float(areas.sum())
     group_total_m2 = round(group_total, ROUND_AREA)
     group_total_ft2 = round(group_total * SQM_TO_SQFT, ROUND_AREA)
-    print(f"  {group_name}: {group_total_m2} m² / {group_total_ft2} sq.ft ({len(items)} items)")
+    print(f"  {group_name}: {group_total_m2} m² / {group_total_ft2} sq.ft ({len(names)} items)")
 
 print(f"\nFile saved as: {SVG_FILE}")
\ No newline at end of file
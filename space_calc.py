@@ -1,11 +1,42 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import csv
-from collections import defaultdict
-from xml.sax.saxutils import escape
+from functools import lru_cache
+import math
+import mmap
+import numpy as np
 from pathlib import Path
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # fall back to pandas or the mmap parser below
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pacompute
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from svg_style import (
+    AREA_UNIT_FT2,
+    AREA_UNIT_M2,
+    ROUND_AREA,
+    SQM_TO_SQFT,
+    build_header,
+    svg_footer,
+)
+
 # ===============================
 # SVG CONFIGURATION
 # ===============================
@@ -18,81 +49,332 @@ START_X_AREA = 1000
 START_Y = 180
 ROW_GAP = 42
 
-FONT_FAMILY_REGULAR = "Roboto"
-FONT_FAMILY_LIGHT = "Roboto Light"
+# Precompiled SVG text templates with the constant x coordinates baked in
+# at import time, so each row substitutes only its y position and text
+TPL_GROUP = f'<text x="{START_X_NAME}" y="%d" class="group">%s</text>\n'
+TPL_GROUP_AREA = f'<text x="{START_X_AREA}" y="%d" class="group-area">%s</text>\n'
+
+# Fused left/right heading template: one % substitution and one encode per
+# emitted row instead of separate calls for the name and area halves
+TPL_GROUP_ROW = TPL_GROUP + TPL_GROUP_AREA
+
+# Partially evaluated fragments for the hottest row type: an item row is
+# emitted by plain concatenation, with no % template parsing per call
+ITEM_PFX = f'<text x="{START_X_NAME + 20}" y="'
+ITEM_MID = '" class="item">'
+ITEM_AREA_PFX = f'</text>\n<text x="{START_X_AREA}" y="'
+ITEM_AREA_MID = '" class="area">'
+ITEM_SFX = '</text>\n'
+
+# Constant document fragments, encoded once at import instead of per export.
+# The page size never changes at runtime, so the whole header — xml prolog,
+# svg tag and style block — is rendered up front too
+HEADER_BYTES = build_header(PAGE_WIDTH, PAGE_HEIGHT).encode("utf-8")
+MAIN_TITLE_BYTES = (
+    f'<text x="{PAGE_WIDTH/2}" y="80" class="main-title" text-anchor="middle">TOTAL CARPET AREA</text>\n'
+).encode("utf-8")
+FOOTER_BYTES = svg_footer.encode("utf-8")
+
+
 
-FONT_SIZE_MAIN_TITLE = 36
-FONT_SIZE_FILE_TITLE = 30
-FONT_SIZE_GROUP = 24
-FONT_SIZE_ITEM = 20
+@lru_cache(maxsize=4096)
+def fmt_area(m2, ft2):
+    """Format a rounded m²/ft² pair; cached because schedules repeat areas."""
+    return f"{m2}{AREA_UNIT_M2} / {ft2}{AREA_UNIT_FT2}"
 
-COLOR_MAIN_TITLE = "#000000"
-COLOR_FILE_TITLE = "#333333"
-COLOR_GROUP = "#000000"
-COLOR_ITEM = "#222222"
-COLOR_AREA = "#444444"
 
-AREA_UNIT_M2 = " m²"
-AREA_UNIT_FT2 = " sq.ft"
-ROUND_AREA = 2
-SQM_TO_SQFT = 10.7639
+# Same entity set as xml.sax.saxutils.escape, but applied in one C-level
+# translate scan instead of one str.replace pass per entity
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def escape(s):
+    """Escape a label for embedding in SVG text content."""
+    return s.translate(_XML_ESC)
+
 
 # ===============================
 # CSV PROCESSING FUNCTIONS
 # ===============================
 
-def process_csv_file(csv_file_path):
-    """Process a single CSV file and return organized data and totals."""
-    groups = defaultdict(list)
-    file_total_area = 0
-    
+
+# Leading characters of a plausible float, in both str and bytes form;
+# checked before calling float() so malformed rows skip the exception
+# machinery entirely
+_FLOAT_LEAD = frozenset("0123456789+-.") | {c.encode() for c in "0123456789+-."}
+
+
+def _sorted_groups_from(groups, group_totals):
+    """Order grouped (names, areas) columns by descending total.
+
+    Native tuple comparison, with the first-seen index breaking ties the
+    same way the vectorized engines do.
+    """
+    pairs = sorted((-group_totals[k], i, k) for i, k in enumerate(groups))
+    out = []
+    for _, _, k in pairs:
+        names, areas = groups[k]
+        out.append((k, (names, np.asarray(areas, dtype=np.float64))))
+    return out
+
+
+def _process_csv_mmap(csv_file_path):
+    """Fallback parser used when polars is unavailable: memory-map the file
+    and scan just the two needed columns by hand."""
+    with open(csv_file_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = mm[:]
+        mm.close()
+
+    header_line, _, body = data.partition(b"\n")
+    cols = [c.strip() for c in header_line.decode("utf-8-sig").strip().split(",")]
+    ix_name = cols.index("IFC Class")
+    ix_area = cols.index("Area")
+    max_ix = max(ix_name, ix_area)
+
+    if b'"' in body:
+        # Quoted fields present — hand row splitting back to csv.reader
+        rows = csv.reader(body.decode("utf-8").splitlines())
+    else:
+        # Well-formed unquoted CSV: plain byte splits, no csv machinery
+        rows = (line.split(b",") for line in body.split(b"\n"))
+
+    # Parallel name/area lists per group — a plain dict probe instead of
+    # defaultdict's __missing__/factory dispatch on the hot path
+    groups = {}
+
+    # Hoist the bound-method lookup out of the row loop
+    groups_get = groups.get
+
+    for parts in rows:
+        if len(parts) <= max_ix:
+            continue
+
+        name = parts[ix_name].strip()
+        area_raw = parts[ix_area].strip()
+
+        if not name or not area_raw:
+            continue
+
+        if area_raw[:1] not in _FLOAT_LEAD:
+            continue
+
+        try:
+            area_value = float(area_raw)
+        except ValueError:
+            continue
+
+        if isinstance(name, bytes):
+            name = name.decode("utf-8")
+
+        # Group key = first word: partition stops at the first
+        # space and allocates no token list (covers the no-space case too).
+        # Interning collapses the repeats to one canonical string, so the
+        # dict probes compare pointers
+        group_key = sys.intern(name.partition(" ")[0])
+
+        bucket = groups_get(group_key)
+        if bucket is None:
+            # Seed the bucket with its first row directly — no empty-list
+            # round trip on the miss path
+            groups[group_key] = ([name], [area_value])
+        else:
+            bucket[0].append(name)
+            bucket[1].append(area_value)
+
+    # Exact per-group sums in one pass each, instead of a per-row float
+    # accumulation that costs an add and a dict store on every line
+    group_totals = {k: math.fsum(bucket[1]) for k, bucket in groups.items()}
+    total_area = math.fsum(group_totals.values())
+
+    sorted_groups = _sorted_groups_from(groups, group_totals)
+
+    return {
+        "sorted_groups": sorted_groups,
+        "file_total_area": total_area,
+        "group_totals": group_totals
+    }
+
+def _process_csv_polars(csv_file_path):
+    """Primary engine: vectorized parse and aggregation in polars."""
+    # Parse with polars: tokenizing, float conversion and null handling
+    # all happen on typed columns instead of a per-row Python loop
+    df = (
+        pl.read_csv(
+            csv_file_path,
+            columns=["IFC Class", "Area"],
+            schema_overrides={"IFC Class": pl.String, "Area": pl.Float64},
+            ignore_errors=True,
+        )
+        .drop_nulls()
+        .with_columns(pl.col("IFC Class").str.strip_chars())
+        .filter(pl.col("IFC Class") != "")
+    )
+
+    # Group key = first word
+    df = df.with_columns(
+        pl.col("IFC Class").str.splitn(" ", 2).struct.field("field_0").alias("group_key")
+    )
+
+    file_total_area = float(df["Area"].sum()) if df.height else 0
+
+    # Group totals aggregated and pre-sorted descending in one vectorized
+    # query, so no Python-level sum or sort pass is needed afterwards
+    totals_df = (
+        df.group_by("group_key", maintain_order=True)
+        .agg(pl.col("Area").sum())
+        .sort("Area", descending=True, maintain_order=True)
+    )
+    group_totals = dict(
+        zip(totals_df["group_key"].to_list(), totals_df["Area"].to_list())
+    )
+
+    # Split into per-group parallel columns (names, areas) — structure of
+    # arrays instead of a Python dict per row
+    groups = {
+        key[0]: (part["IFC Class"].to_list(), part["Area"].to_numpy())
+        for key, part in df.partition_by("group_key", as_dict=True).items()
+    }
+
+    # totals_df is already sorted by total area descending
+    sorted_groups = [(k, groups[k]) for k in totals_df["group_key"].to_list()]
+
+    return {
+        "sorted_groups": sorted_groups,
+        "file_total_area": file_total_area,
+        "group_totals": group_totals
+    }
+
+
+
+def _process_csv_pyarrow(csv_file_path):
+    """Engine used when polars is missing but pyarrow is available.
+
+    Tokenizing and float conversion run in Arrow's SIMD C reader; only the
+    grouping walks the typed columns in Python. Raises ArrowInvalid on
+    malformed numeric cells, in which case the dispatcher falls through to
+    a more lenient engine.
+    """
+    # Zero-copy input: memory-map the file through Arrow's own reader, so
+    # tokenizing runs straight out of the page cache without a Python-level
+    # read-and-copy pass (and Arrow manages the mapping's lifetime)
+    with pa.memory_map(csv_file_path) as source:
+        table = pacsv.read_csv(
+            source,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=["IFC Class", "Area"],
+                column_types={"IFC Class": pa.string(), "Area": pa.float64()},
+            ),
+        )
+    # Validate all rows upfront with Arrow compute instead of branching on
+    # each one in Python: strip the names, then keep only rows where the
+    # stripped name is non-empty and the area parsed (null comparisons fall
+    # out of the filter along with the explicit mask)
+    names_arr = pacompute.utf8_trim_whitespace(table.column("IFC Class"))
+    areas_arr = table.column("Area")
+    keep = pacompute.and_(pacompute.not_equal(names_arr, ""), areas_arr.is_valid())
+    names_col = names_arr.filter(keep).to_pylist()
+    areas_col = areas_arr.filter(keep).to_numpy(zero_copy_only=False)
+
+    # One C-level pairwise reduction instead of a per-row Python accumulator
+    total_area = float(areas_col.sum()) if len(areas_col) else 0.0
+
+    groups = {}
+    group_totals = {}
+
+    # Hoist bound-method lookups out of the row loop
+    groups_get = groups.get
+    totals_get = group_totals.get
+
+    for name, area_value in zip(names_col, areas_col.tolist()):
+        # Group key = first word, interned so repeated keys share one
+        # canonical string and dict probes compare pointers
+        group_key = sys.intern(name.partition(" ")[0])
+
+        bucket = groups_get(group_key)
+        if bucket is None:
+            # Seed the bucket with its first row directly — no empty-list
+            # round trip on the miss path
+            groups[group_key] = ([name], [area_value])
+        else:
+            bucket[0].append(name)
+            bucket[1].append(area_value)
+        group_totals[group_key] = totals_get(group_key, 0.0) + area_value
+
+    return {
+        "sorted_groups": _sorted_groups_from(groups, group_totals),
+        "file_total_area": total_area,
+        "group_totals": group_totals
+    }
+
+
+def _process_csv_pandas(csv_file_path):
+    """Engine used when polars is missing but pandas is available."""
+    df = pd.read_csv(
+        csv_file_path,
+        usecols=["IFC Class", "Area"],
+        dtype={"IFC Class": "string"},
+        na_filter=False,
+        engine="c",
+    )
+    df["Area"] = pd.to_numeric(df["Area"], errors="coerce")
+    df["IFC Class"] = df["IFC Class"].str.strip()
+    df = df[df["Area"].notna() & (df["IFC Class"] != "")]
+
+    # Group key = first word
+    df["group_key"] = df["IFC Class"].str.split(" ", n=1).str[0]
+
+    file_total_area = float(df["Area"].sum()) if len(df) else 0
+
+    # Vectorized aggregation; the stable descending sort keeps ties in
+    # first-seen order like the polars engine
+    totals = (
+        df.groupby("group_key", sort=False)["Area"]
+        .sum()
+        .sort_values(ascending=False, kind="stable")
+    )
+    group_totals = totals.to_dict()
+
+    groups = {
+        k: (part["IFC Class"].tolist(), part["Area"].to_numpy())
+        for k, part in df.groupby("group_key", sort=False)
+    }
+    sorted_groups = [(k, groups[k]) for k in totals.index]
+
+    return {
+        "sorted_groups": sorted_groups,
+        "file_total_area": file_total_area,
+        "group_totals": group_totals
+    }
+
+
+def process_csv_file(csv_file_path, basename=None):
+    """Process a single CSV file and return organized data and totals.
+
+    Callers that already display the file's name (the GUI listbox) pass
+    the stem through as basename instead of having it re-derived here.
+    """
     try:
-        with open(csv_file_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row in reader:
-                name = row.get("IFC Class", "").strip()
-                area_raw = row.get("Area", "").strip()
-                
-                if not name or not area_raw:
-                    continue
-                
+        if pl is not None:
+            data = _process_csv_polars(csv_file_path)
+        else:
+            data = None
+            if pa is not None:
                 try:
-                    area_value = float(area_raw)
-                    file_total_area += area_value
-                except ValueError:
-                    continue
-                
-                # Group key = first word
-                group_key = name.split()[0]
-                
-                groups[group_key].append({
-                    "name": name,
-                    "area": area_value
-                })
-        
-        # Calculate group totals for sorting
-        group_totals = {}
-        for k, items in groups.items():
-            total_area = sum(item["area"] for item in items)
-            group_totals[k] = total_area
-        
-        # Sort groups by total area descending
-        sorted_groups = sorted(
-            groups.items(),
-            key=lambda g: group_totals[g[0]],
-            reverse=True
-        )
-        
-        return {
-            "filename": os.path.basename(csv_file_path),
-            "filepath": csv_file_path,
-            "basename": os.path.splitext(os.path.basename(csv_file_path))[0],
-            "sorted_groups": sorted_groups,
-            "file_total_area": file_total_area,
-            "group_totals": group_totals
-        }
-    
+                    data = _process_csv_pyarrow(csv_file_path)
+                except (pa.lib.ArrowInvalid, pa.lib.ArrowNotImplementedError):
+                    pass  # input Arrow can't handle — retry with a lenient engine
+            if data is None:
+                if pd is not None:
+                    data = _process_csv_pandas(csv_file_path)
+                else:
+                    data = _process_csv_mmap(csv_file_path)
+
+        filename = os.path.basename(csv_file_path)
+        data["filename"] = filename
+        data["filepath"] = csv_file_path
+        data["basename"] = os.path.splitext(filename)[0] if basename is None else basename
+        return data
     except Exception as e:
         print(f"Error processing {csv_file_path}: {e}")
         return None
@@ -102,184 +384,139 @@ def generate_svg(ordered_files, output_path="area_schedule.svg"):
     if not ordered_files:
         return False, "No files selected"
     
-    # Process all CSV files in order
-    file_data_list = []
-    grand_total_area = 0
-    
-    for csv_file in ordered_files:
-        file_data = process_csv_file(csv_file)
-        if file_data:
-            file_data_list.append(file_data)
-            grand_total_area += file_data["file_total_area"]
-    
+    # Process all CSV files in parallel — each file is independent, and
+    # ex.map keeps the results in input order. Threads suffice: the
+    # polars/pyarrow/pandas readers release the GIL while parsing, and
+    # unlike worker processes there is no result pickling or interpreter
+    # spawn cost on every export
+    # Entries are plain paths, or (path, basename) pairs from the GUI,
+    # which already knows each file's display name
+    entries = [e if isinstance(e, tuple) else (e, None) for e in ordered_files]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        file_data_list = [fd for fd in ex.map(lambda e: process_csv_file(*e), entries) if fd]
+
+    grand_total_area = sum(fd["file_total_area"] for fd in file_data_list)
+
     if not file_data_list:
         return False, "No valid data found in CSV files"
     
     # ===============================
     # BUILD SVG CONTENT
     # ===============================
-    
-    svg_header = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     width="{PAGE_WIDTH}" height="{PAGE_HEIGHT}"
-     viewBox="0 0 {PAGE_WIDTH} {PAGE_HEIGHT}">
-
-<style>
-  @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400&amp;display=swap');
-  .main-title {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_MAIN_TITLE}px;
-    font-weight: bold;
-    fill: {COLOR_MAIN_TITLE};
-  }}
-  .file-title {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_FILE_TITLE}px;
-    font-weight: bold;
-    fill: {COLOR_FILE_TITLE};
-  }}
-  .group {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_GROUP}px;
-    font-weight: bold;
-    fill: {COLOR_GROUP};
-  }}
-  .item {{
-    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
-    font-size: {FONT_SIZE_ITEM}px;
-    fill: {COLOR_ITEM};
-  }}
-  .area {{
-    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
-    font-size: {FONT_SIZE_ITEM}px;
-    fill: {COLOR_AREA};
-    text-anchor: end;
-  }}
-  .group-area {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_GROUP}px;
-    font-weight: bold;
-    fill: {COLOR_GROUP};
-    text-anchor: end;
-  }}
-  .file-total {{
-    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
-    font-size: {FONT_SIZE_FILE_TITLE}px;
-    font-weight: bold;
-    fill: {COLOR_FILE_TITLE};
-    text-anchor: end;
-  }}
-</style>
-'''
-    
-    svg_footer = "</svg>"
-    
-    elements = []
-    
+
+    # Escape each unique label once up front; the emit loops below then do
+    # plain dict lookups instead of re-running escape() per row
+    unique_names = set()
+    for file_data in file_data_list:
+        unique_names.add(file_data["basename"])
+        for group_name, (names, _) in file_data["sorted_groups"]:
+            unique_names.add(group_name)
+            unique_names.update(names)
+    escaped = {n: escape(n) for n in unique_names}
+
     # Main title with GRAND TOTAL
     grand_total_m2 = round(grand_total_area, ROUND_AREA)
     grand_total_ft2 = round(grand_total_area * SQM_TO_SQFT, ROUND_AREA)
-    grand_total_text = f"{grand_total_m2}{AREA_UNIT_M2} / {grand_total_ft2}{AREA_UNIT_FT2}"
-    
-    elements.append(
-        f'<text x="{PAGE_WIDTH/2}" y="80" class="main-title" text-anchor="middle">TOTAL CARPET AREA</text>'
-    )
-    elements.append(
-        f'<text x="{PAGE_WIDTH/2}" y="130" class="main-title" text-anchor="middle">{grand_total_text}</text>'
-    )
-    
-    y = START_Y
-    
-    # Process each file
-    for file_data in file_data_list:
-        basename = file_data["basename"]
-        sorted_groups = file_data["sorted_groups"]
-        file_total_area = file_data["file_total_area"]
-        
-        # File title with its total area
-        file_total_m2 = round(file_total_area, ROUND_AREA)
-        file_total_ft2 = round(file_total_area * SQM_TO_SQFT, ROUND_AREA)
-        file_total_text = f"{file_total_m2}{AREA_UNIT_M2} / {file_total_ft2}{AREA_UNIT_FT2}"
-        
-        # File name on the left
-        elements.append(
-            f'<text x="{START_X_NAME}" y="{y}" class="file-title">{escape(basename)}</text>'
-        )
-        # File total on the right (right-aligned)
-        elements.append(
-            f'<text x="{START_X_AREA}" y="{y}" class="file-total">{file_total_text}</text>'
-        )
-        y += ROW_GAP + 10  # Extra space after file title
-        
-        # Process groups within this file
-        for group_name, items in sorted_groups:
-            # Single-space entry (main space without sub-items)
-            if len(items) == 1:
-                item = items[0]
-                area_m2 = round(item['area'], ROUND_AREA)
-                area_ft2 = round(item['area'] * SQM_TO_SQFT, ROUND_AREA)
-                area_text = f"{area_m2}{AREA_UNIT_M2} / {area_ft2}{AREA_UNIT_FT2}"
-                
-                # Name on the left
-                elements.append(
-                    f'<text x="{START_X_NAME}" y="{y}" class="group">{escape(item["name"])}</text>'
-                )
-                # Area on the right (right-aligned)
-                elements.append(
-                    f'<text x="{START_X_AREA}" y="{y}" class="group-area">{area_text}</text>'
-                )
-                y += ROW_GAP
-                continue  # skip the normal group loop
-            
-            # Multi-space group heading with total area
-            group_total = round(sum(item["area"] for item in items), ROUND_AREA)
-            total_ft2 = round(group_total * SQM_TO_SQFT, ROUND_AREA)
-            total_text = f"{group_total}{AREA_UNIT_M2} / {total_ft2}{AREA_UNIT_FT2}"
-            
-            # Group name on the left
-            elements.append(
-                f'<text x="{START_X_NAME}" y="{y}" class="group">{escape(group_name)}</text>'
-            )
-            # Total area on the right (right-aligned)
-            elements.append(
-                f'<text x="{START_X_AREA}" y="{y}" class="group-area">(Total: {total_text})</text>'
-            )
-            y += ROW_GAP
-            
-            # Sort items inside group by area descending
-            items.sort(key=lambda x: x["area"], reverse=True)
-            
-            for item in items:
-                area_m2 = round(item['area'], ROUND_AREA)
-                area_ft2 = round(item['area'] * SQM_TO_SQFT, ROUND_AREA)
-                area_text = f"{area_m2}{AREA_UNIT_M2} / {area_ft2}{AREA_UNIT_FT2}"
-                
-                # Item name on the left (indented)
-                elements.append(
-                    f'<text x="{START_X_NAME + 20}" y="{y}" class="item">{escape(item["name"])}</text>'
-                )
-                # Item area on the right (right-aligned)
-                elements.append(
-                    f'<text x="{START_X_AREA}" y="{y}" class="area">{area_text}</text>'
-                )
-                
-                y += ROW_GAP
-            
-            # Space between groups
-            y += 12
-        
-        # Add more space between files
-        y += 40
-    
-    # Write SVG file
+    grand_total_text = fmt_area(grand_total_m2, grand_total_ft2)
+
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(svg_header)
-            f.write("\n".join(elements))
-            f.write(svg_footer)
-        
+        # Stream pre-encoded UTF-8 fragments through a large buffered
+        # binary writer: no second full-document copy in RAM, and the
+        # buffer keeps actual write syscalls rare
+        with open(output_path, "wb", buffering=1 << 20) as out:
+            write = out.write
+            write(HEADER_BYTES)
+            write(MAIN_TITLE_BYTES)
+            write((
+                f'<text x="{PAGE_WIDTH/2}" y="130" class="main-title" text-anchor="middle">{grand_total_text}</text>\n'
+            ).encode("utf-8"))
+
+            y = START_Y
+
+            # Process each file
+            for file_data in file_data_list:
+                basename = file_data["basename"]
+                sorted_groups = file_data["sorted_groups"]
+                file_total_area = file_data["file_total_area"]
+                group_totals = file_data["group_totals"]
+
+                # File title with its total area
+                file_total_m2 = round(file_total_area, ROUND_AREA)
+                file_total_ft2 = round(file_total_area * SQM_TO_SQFT, ROUND_AREA)
+                file_total_text = fmt_area(file_total_m2, file_total_ft2)
+
+                # File name on the left
+                write((
+                    f'<text x="{START_X_NAME}" y="{y}" class="file-title">{escaped[basename]}</text>\n'
+                ).encode("utf-8"))
+                # File total on the right (right-aligned)
+                write((
+                    f'<text x="{START_X_AREA}" y="{y}" class="file-total">{file_total_text}</text>\n'
+                ).encode("utf-8"))
+                y += ROW_GAP + 10  # Extra space after file title
+
+                # Process groups within this file
+                for group_name, (names, areas) in sorted_groups:
+                    single = len(names) == 1
+
+                    # Both group shapes emit the same heading row — a lone
+                    # space carries its own area there, a multi-space group
+                    # its parser-accumulated total
+                    if single:
+                        # Nothing to sort, round the lone value directly
+                        m2_arr = np.round(areas, ROUND_AREA)
+                        ft2_arr = np.round(areas * SQM_TO_SQFT, ROUND_AREA)
+                        heading_name = escaped[names[0]]
+                        heading_area = fmt_area(float(m2_arr[0]), float(ft2_arr[0]))
+                    else:
+                        heading_name = escaped[group_name]
+                        group_total = round(group_totals[group_name], ROUND_AREA)
+                        total_ft2 = round(group_total * SQM_TO_SQFT, ROUND_AREA)
+                        heading_area = f"(Total: {fmt_area(group_total, total_ft2)})"
+
+                    # Heading name on the left, area on the right (right-aligned)
+                    write((TPL_GROUP_ROW % (y, heading_name, y, heading_area)).encode("utf-8"))
+                    y += ROW_GAP
+
+                    if single:
+                        continue  # no item rows to emit
+
+                    # Sort items inside group by area descending (stable argsort on the
+                    # area column instead of a Python key-function sort)
+                    order = np.argsort(-areas, kind="stable")
+                    areas = areas[order]
+
+                    # Vectorize rounding and m²→ft² conversion for the whole group at once
+                    m2_arr = np.round(areas, ROUND_AREA)
+                    ft2_arr = np.round(areas * SQM_TO_SQFT, ROUND_AREA)
+
+                    # Plain Python floats for the format cache: canonical,
+                    # cheaper-to-hash keys than NumPy scalar objects
+                    m2_list = m2_arr.tolist()
+                    ft2_list = ft2_arr.tolist()
+
+                    for i, j in enumerate(order):
+                        y_str = str(y)
+
+                        # Item name on the left (indented), area on the right
+                        write("".join((
+                            ITEM_PFX, y_str, ITEM_MID, escaped[names[j]],
+                            ITEM_AREA_PFX, y_str, ITEM_AREA_MID,
+                            fmt_area(m2_list[i], ft2_list[i]), ITEM_SFX,
+                        )).encode("utf-8"))
+
+                        y += ROW_GAP
+
+                    # Space between groups
+                    y += 12
+
+                # Add more space between files
+                y += 40
+
+            write(FOOTER_BYTES)
+
         return True, f"SVG generated successfully: {output_path}\nProcessed {len(file_data_list)} files\nGrand Total: {grand_total_m2} m² / {grand_total_ft2} sq.ft"
-    
+
     except Exception as e:
         return False, f"Error writing SVG file: {e}"
 
@@ -371,13 +608,13 @@ class CSVProcessorGUI:
         filename_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Generate button
-        generate_button = ttk.Button(
+        self.generate_button = ttk.Button(
             main_frame, 
             text="Generate SVG", 
             command=self.generate_svg,
             style="Accent.TButton"
         )
-        generate_button.grid(row=5, column=0, columnspan=2, pady=(10, 0))
+        self.generate_button.grid(row=5, column=0, columnspan=2, pady=(10, 0))
         
         # Status label
         self.status_label = ttk.Label(main_frame, text="Ready to add CSV files", foreground="blue")
@@ -403,9 +640,12 @@ class CSVProcessorGUI:
         
         if files:
             for file in files:
-                if file not in self.csv_files:
-                    self.csv_files.append(file)
-                    self.listbox.insert(tk.END, os.path.basename(file))
+                if all(file != path for path, _ in self.csv_files):
+                    filename = os.path.basename(file)
+                    # Keep the stem the SVG titles use alongside the path so
+                    # each export doesn't re-derive it
+                    self.csv_files.append((file, os.path.splitext(filename)[0]))
+                    self.listbox.insert(tk.END, filename)
             
             self.update_status(f"Added {len(files)} file(s). Total: {len(self.csv_files)}")
     
@@ -464,13 +704,26 @@ class CSVProcessorGUI:
         elif not output_filename.lower().endswith('.svg'):
             output_filename += '.svg'
         
-        # Update status
+        # Run the export off the Tk thread so the window keeps redrawing
+        # while files are parsed; no busy root.update() polling. The button
+        # is disabled until the worker reports back, so a second click can't
+        # start a concurrent export over the same output file
+        self.generate_button.config(state=tk.DISABLED)
         self.update_status("Processing CSV files...", "blue")
-        self.root.update()
-        
-        # Generate SVG
-        success, message = generate_svg(self.csv_files, output_filename)
-        
+        threading.Thread(
+            target=self._generate_svg_worker,
+            args=(list(self.csv_files), output_filename),
+            daemon=True,
+        ).start()
+    
+    def _generate_svg_worker(self, csv_files, output_filename):
+        """Run the export in the background and marshal the result back."""
+        success, message = generate_svg(csv_files, output_filename)
+        self.root.after(0, self._on_generate_done, success, message)
+    
+    def _on_generate_done(self, success, message):
+        """Show the export result (runs back on the Tk thread)."""
+        self.generate_button.config(state=tk.NORMAL)
         if success:
             self.update_status(message, "green")
             messagebox.showinfo("Success", message)
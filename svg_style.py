@@ -0,0 +1,91 @@
+"""Shared SVG style constants and header construction for the schedule scripts."""
+
+import functools
+
+# ===============================
+# STYLE CONSTANTS
+# ===============================
+
+FONT_FAMILY_REGULAR = "Roboto"
+FONT_FAMILY_LIGHT = "Roboto Light"
+
+FONT_SIZE_MAIN_TITLE = 36
+FONT_SIZE_FILE_TITLE = 30
+FONT_SIZE_GROUP = 24
+FONT_SIZE_ITEM = 20
+
+COLOR_MAIN_TITLE = "#000000"
+COLOR_FILE_TITLE = "#333333"
+COLOR_GROUP = "#000000"
+COLOR_ITEM = "#222222"
+COLOR_AREA = "#444444"
+
+AREA_UNIT_M2 = " m²"
+AREA_UNIT_FT2 = " sq.ft"
+ROUND_AREA = 2
+
+# Conversion factor
+SQM_TO_SQFT = 10.7639
+
+svg_footer = "</svg>"
+
+
+@functools.lru_cache(maxsize=8)
+def build_header(page_width, page_height):
+    """Return the SVG opening tag and style block for the given page size.
+
+    Cached so repeated exports at the same size (the common GUI case) reuse
+    the already-interpolated string instead of re-rendering the style block.
+    """
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     width="{page_width}" height="{page_height}"
+     viewBox="0 0 {page_width} {page_height}">
+
+<style>
+  @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400&amp;display=swap');
+  .main-title {{
+    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
+    font-size: {FONT_SIZE_MAIN_TITLE}px;
+    font-weight: bold;
+    fill: {COLOR_MAIN_TITLE};
+  }}
+  .file-title {{
+    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
+    font-size: {FONT_SIZE_FILE_TITLE}px;
+    font-weight: bold;
+    fill: {COLOR_FILE_TITLE};
+  }}
+  .group {{
+    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
+    font-size: {FONT_SIZE_GROUP}px;
+    font-weight: bold;
+    fill: {COLOR_GROUP};
+  }}
+  .item {{
+    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
+    font-size: {FONT_SIZE_ITEM}px;
+    fill: {COLOR_ITEM};
+  }}
+  .area {{
+    font-family: "{FONT_FAMILY_LIGHT}", sans-serif;
+    font-size: {FONT_SIZE_ITEM}px;
+    fill: {COLOR_AREA};
+    text-anchor: end;
+  }}
+  .group-area {{
+    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
+    font-size: {FONT_SIZE_GROUP}px;
+    font-weight: bold;
+    fill: {COLOR_GROUP};
+    text-anchor: end;
+  }}
+  .file-total {{
+    font-family: "{FONT_FAMILY_REGULAR}", sans-serif;
+    font-size: {FONT_SIZE_FILE_TITLE}px;
+    font-weight: bold;
+    fill: {COLOR_FILE_TITLE};
+    text-anchor: end;
+  }}
+</style>
+'''